@@ -3,13 +3,23 @@ Hyperliquid Liquidation Heatmap Fetcher
 Fetches top 100 traders' positions and extracts liquidation prices.
 """
 
-import json
-import requests
+import asyncio
+import hashlib
+import os
+from aiolimiter import AsyncLimiter
+import httpx
+import numpy as np
+import orjson
 from datetime import datetime
-from collections import defaultdict
 import time
 
 DATA_FILE = 'data.json'
+CACHE_DIR = '.cache'
+
+# Cache lifetimes in seconds, matched to how often each source changes
+LEADERBOARD_TTL = 300
+CLEARINGHOUSE_TTL = 60
+PRICES_TTL = 15
 
 HEADERS = {
     'Content-Type': 'application/json',
@@ -17,6 +27,27 @@ HEADERS = {
 }
 
 API_URL = 'https://api.hyperliquid.xyz/info'
+LEADERBOARD_URL = 'https://stats-data.hyperliquid.xyz/Mainnet/leaderboard'
+
+# Keys that may hold the wallet address in a leaderboard row, in priority order
+_WALLET_KEYS = ('ethAddress', 'user', 'address')
+
+# Transient failures worth retrying with exponential backoff; other 4xx fail fast
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_RETRIES = 5
+RETRY_BACKOFF = 0.5
+
+# Connection pool for the shared HTTP/2 client; one TLS connection usually carries everything
+CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=60)
+
+# In-flight wallet fetches
+MAX_CONCURRENCY = 20
+
+# Hyperliquid allows 1200 request weight per minute per IP; clearinghouseState weighs 2,
+# other info requests 20
+RATE_LIMIT_WEIGHT = 1200
+CLEARINGHOUSE_WEIGHT = 2
+INFO_WEIGHT = 20
 
 # Top 10 coins to track
 TOP_COINS = ['BTC', 'ETH', 'SOL', 'HYPE', 'XRP', 'DOGE', 'SUI', 'LINK', 'AVAX', 'PEPE']
@@ -29,79 +60,156 @@ LEVERAGE_BUCKETS = [
     {'min': 51, 'max': 100, 'label': '100x', 'color': '#ef4444'}  # Red
 ]
 
+# Parallel views of LEVERAGE_BUCKETS, indexed by bucket position
+_LEV_MAX = tuple(bucket['max'] for bucket in LEVERAGE_BUCKETS)
+_LEV_LABEL = tuple(bucket['label'] for bucket in LEVERAGE_BUCKETS)
+
+# Price buckets span ±30% around the current price
+NUM_BUCKETS = 50
+PRICE_RANGE = 0.3
+
+# Column layout of the per-side bucket matrices: total first, then one per leverage bucket
+LEV_COL = {label: i + 1 for i, label in enumerate(_LEV_LABEL)}
+
+
+def _cache_path(namespace, key):
+    digest = hashlib.md5(key.encode()).hexdigest()
+    return os.path.join(CACHE_DIR, namespace, f'{digest}.json')
 
-def get_leverage_bucket(leverage):
-    """Get leverage bucket label"""
-    for bucket in LEVERAGE_BUCKETS:
-        if bucket['min'] <= leverage <= bucket['max']:
-            return bucket['label']
-    return '100x'
+
+def cache_get(namespace, key, ttl):
+    """Return cached data if it is younger than ttl seconds, else None"""
+    # Missing, unreadable or malformed entries all count as a miss
+    try:
+        with open(_cache_path(namespace, key), 'rb') as f:
+            entry = orjson.loads(f.read())
+        if time.time() - entry['ts'] >= ttl:
+            return None
+        return entry['data']
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+
+
+def cache_set(namespace, key, data):
+    """Store data in the on-disk cache; best-effort, write failures are ignored"""
+    path = _cache_path(namespace, key)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps({'ts': time.time(), 'data': data}))
+    except OSError:
+        pass
 
 
-def fetch_leaderboard():
+def get_leverage_columns(leverage):
+    """Get the LEV_COL matrix column for each value in a leverage array"""
+    # Anything above the last bound still counts as the top bucket
+    idx = np.searchsorted(_LEV_MAX, leverage, side='left')
+    return np.minimum(idx, len(_LEV_MAX) - 1) + 1
+
+
+def _extract_wallet(entry):
+    """Get the wallet address from a leaderboard row, which may be a dict or a bare string"""
+    if isinstance(entry, dict):
+        return next((entry[k] for k in _WALLET_KEYS if entry.get(k)), None)
+    if isinstance(entry, str):
+        return entry
+    return None
+
+
+async def fetch_leaderboard(client, limiter, slots):
     """Fetch top traders from leaderboard"""
+    cached = cache_get('leaderboard', 'leaderboard', LEADERBOARD_TTL)
+    if cached:
+        print(f"  Leaderboard (cached): {len(cached)} traders found")
+        return cached
+    
     try:
-        # Hyperliquid leaderboard endpoint
-        url = 'https://stats-data.hyperliquid.xyz/Mainnet/leaderboard'
-        response = requests.get(url, headers=HEADERS, timeout=30)
-        response.raise_for_status()
-        data = response.json()
-        
-        wallets = []
+        # Hyperliquid leaderboard endpoint (stats host, outside the /info weight budget)
+        data = await request_json(client, limiter, slots, 'GET', LEADERBOARD_URL, timeout=30)
         
         # Handle different response formats
         if isinstance(data, dict) and 'leaderboardRows' in data:
-            for entry in data['leaderboardRows'][:200]:
-                wallet = entry.get('ethAddress') or entry.get('user')
-                if wallet:
-                    wallets.append(wallet)
+            rows = data['leaderboardRows']
         elif isinstance(data, list):
-            for entry in data[:200]:
-                if isinstance(entry, dict):
-                    wallet = entry.get('ethAddress') or entry.get('user') or entry.get('address')
-                    if wallet:
-                        wallets.append(wallet)
-                elif isinstance(entry, str):
-                    wallets.append(entry)
+            rows = data
+        else:
+            rows = []
+        
+        wallets = [w for w in map(_extract_wallet, rows[:200]) if w]
         
         print(f"  Leaderboard: {len(wallets)} traders found")
+        if wallets:
+            cache_set('leaderboard', 'leaderboard', wallets)
         return wallets
     except Exception as e:
         print(f"  Leaderboard error: {e}")
         # Fallback: try alternative endpoint
         try:
             payload = {"type": "leaderboard", "timeWindow": "day"}
-            response = requests.post(API_URL, json=payload, headers=HEADERS, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = await request_json(client, limiter, slots, 'POST', API_URL, INFO_WEIGHT, json=payload, timeout=30)
             
-            wallets = []
-            if isinstance(data, list):
-                for entry in data[:200]:
-                    if isinstance(entry, dict):
-                        wallet = entry.get('ethAddress') or entry.get('user')
-                        if wallet:
-                            wallets.append(wallet)
+            rows = data if isinstance(data, list) else []
+            wallets = [w for w in map(_extract_wallet, rows[:200]) if w]
             print(f"  Leaderboard (fallback): {len(wallets)} traders found")
+            if wallets:
+                cache_set('leaderboard', 'leaderboard', wallets)
             return wallets
         except Exception as e2:
             print(f"  Leaderboard fallback error: {e2}")
             return []
 
 
-def fetch_clearinghouse_state(wallet):
+async def request_json(client, limiter, slots, method, url, weight=0, **kwargs):
+    """Send a request and decode its JSON body, retrying transient failures with exponential backoff
+
+    limiter is the run's AsyncLimiter and slots its in-flight semaphore; both are
+    created per run so they bind to the running event loop. weight is the request's
+    cost against Hyperliquid's per-minute /info budget.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        delay = RETRY_BACKOFF * 2 ** attempt
+        try:
+            async with slots:
+                if weight:
+                    await limiter.acquire(weight)
+                response = await client.request(method, url, **kwargs)
+            
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                response.raise_for_status()
+                return orjson.loads(response.content)
+            
+            # Honour the server's Retry-After hint when given in seconds
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                delay = int(retry_after)
+        except httpx.TransportError:
+            if attempt == MAX_RETRIES:
+                raise
+        
+        await asyncio.sleep(delay)
+
+
+async def fetch_clearinghouse_state(client, limiter, slots, wallet):
     """Fetch user's positions and liquidation prices"""
+    cached = cache_get('clearinghouse', wallet, CLEARINGHOUSE_TTL)
+    if cached is not None:
+        return cached
+    
     try:
         payload = {"type": "clearinghouseState", "user": wallet}
-        response = requests.post(API_URL, json=payload, headers=HEADERS, timeout=15)
-        response.raise_for_status()
-        data = response.json()
+        data = await request_json(client, limiter, slots, 'POST', API_URL, CLEARINGHOUSE_WEIGHT, json=payload, timeout=15)
+        
+        if not isinstance(data, dict):
+            raise ValueError(f"unexpected response {data!r:.80}")
         
         positions = []
-        asset_positions = data.get('assetPositions', [])
+        asset_positions = data.get('assetPositions') or []
         
         for ap in asset_positions:
-            pos = ap.get('position', {})
+            pos = ap.get('position') if isinstance(ap, dict) else None
+            if not isinstance(pos, dict):
+                continue
             coin = pos.get('coin', '')
             
             if coin not in TOP_COINS:
@@ -113,39 +221,58 @@ def fetch_clearinghouse_state(wallet):
             leverage_info = pos.get('leverage', {})
             
             if liq_price and entry_price:
-                # Determine if long or short
-                size_float = float(size) if size else 0
-                is_long = size_float > 0
-                
                 # Get leverage value
                 leverage = leverage_info.get('value', 1) if isinstance(leverage_info, dict) else 1
                 
-                # Calculate position value
-                position_value = abs(size_float) * float(entry_price)
-                
-                positions.append({
-                    'coin': coin,
-                    'liquidationPx': float(liq_price),
-                    'entryPx': float(entry_price),
-                    'size': abs(size_float),
-                    'positionValue': position_value,
-                    'leverage': leverage,
-                    'leverageBucket': get_leverage_bucket(leverage),
-                    'side': 'long' if is_long else 'short'
-                })
+                # Prices and size stay raw strings; build_position_arrays casts them in bulk
+                positions.append((coin, liq_price, entry_price, size or '0', leverage))
         
+        # Check this wallet's numeric fields here so a malformed value drops only this
+        # wallet and is never cached, instead of failing the bulk cast in aggregation
+        numeric = np.asarray([p[1:] for p in positions], dtype=np.float64)
+        if not np.isfinite(numeric).all():
+            raise ValueError("non-numeric position field")
+        
+        cache_set('clearinghouse', wallet, positions)
         return positions
-    except Exception as e:
+    except (httpx.HTTPError, ValueError, TypeError, AttributeError) as e:
+        # HTTP/transport failures, undecodable JSON, unexpected shapes and unparseable
+        # numbers all drop just this wallet; cache errors never reach here
+        print(f"  Positions error for {wallet}: {e}")
         return []
 
 
-def fetch_current_prices():
+async def fetch_all_positions(client, limiter, slots, wallets):
+    """Fetch positions for every wallet concurrently"""
+    # /info takes a single request object per call, so batching is not an option;
+    # HTTP/2 instead multiplexes every wallet request over one TLS connection
+    all_positions = []
+    tasks = [asyncio.ensure_future(fetch_clearinghouse_state(client, limiter, slots, wallet)) for wallet in wallets]
+    
+    try:
+        for i, task in enumerate(asyncio.as_completed(tasks)):
+            all_positions.extend(await task)
+            
+            if (i + 1) % 20 == 0:
+                print(f"  Processed {i + 1}/{len(wallets)} wallets ({len(all_positions)} positions found)")
+    finally:
+        # If one task raised, don't leave the rest running against a closing client
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    return all_positions
+
+
+async def fetch_current_prices(client, limiter, slots):
     """Fetch current mark prices for all coins"""
+    cached = cache_get('prices', 'metaAndAssetCtxs', PRICES_TTL)
+    if cached:
+        return cached
+    
     try:
         payload = {"type": "metaAndAssetCtxs"}
-        response = requests.post(API_URL, json=payload, headers=HEADERS, timeout=20)
-        response.raise_for_status()
-        data = response.json()
+        data = await request_json(client, limiter, slots, 'POST', API_URL, INFO_WEIGHT, json=payload, timeout=20)
         
         prices = {}
         if len(data) >= 2:
@@ -158,148 +285,162 @@ def fetch_current_prices():
                     mark_price = float(contexts[i].get('markPx', 0) or 0)
                     prices[coin] = mark_price
         
+        if prices:
+            cache_set('prices', 'metaAndAssetCtxs', prices)
         return prices
     except Exception as e:
         print(f"  Price fetch error: {e}")
         return {}
 
 
+def build_position_arrays(all_positions):
+    """Convert raw (coin, liquidationPx, entryPx, szi, leverage) tuples into parallel NumPy arrays"""
+    coin_ids = {coin: i for i, coin in enumerate(TOP_COINS)}
+    coins, liq_prices, entry_prices, sizes, leverages = zip(*all_positions) if all_positions else ((),) * 5
+    
+    # One C-level cast per column instead of a float() call per field
+    size = np.asarray(sizes, dtype=np.float64)
+    entry_price = np.asarray(entry_prices, dtype=np.float64)
+    
+    return {
+        'coin': np.array([coin_ids[c] for c in coins], dtype=np.intp),
+        'liquidationPx': np.asarray(liq_prices, dtype=np.float64),
+        'positionValue': np.abs(size) * entry_price,
+        'isLong': size > 0,
+        'leverageCol': get_leverage_columns(np.asarray(leverages, dtype=np.float64))
+    }
+
+
+def bucketize(positions, price_min, price_max, bucket_size, num_buckets):
+    """Sum position values for every coin in one pass.
+
+    price_min, price_max and bucket_size are per-coin arrays indexed by coin id.
+    Returns occupancy counts shaped (2, n_coins, num_buckets) and values shaped
+    (2, n_coins, num_buckets, 5), where axis 0 is the side (0 = long, 1 = short)
+    and the last axis is laid out per LEV_COL.
+    """
+    coin = positions['coin']
+    liq_price = positions['liquidationPx']
+    
+    # Coins without a price have a zero-width range and are dropped here
+    in_range = (liq_price >= price_min[coin]) & (liq_price <= price_max[coin]) & (bucket_size[coin] > 0)
+    coin = coin[in_range]
+    value = positions['positionValue'][in_range]
+    leverage_col = positions['leverageCol'][in_range]
+    side = (~positions['isLong'][in_range]).astype(np.intp)
+    
+    # Find bucket index
+    bucket_idx = ((liq_price[in_range] - price_min[coin]) / bucket_size[coin]).astype(np.intp)
+    bucket_idx = np.minimum(bucket_idx, num_buckets - 1)
+    
+    n_coins = len(price_min)
+    counts = np.zeros((2, n_coins, num_buckets), dtype=np.intp)
+    matrix = np.zeros((2, n_coins, num_buckets, len(LEV_COL) + 1), dtype=np.float64)
+    np.add.at(counts, (side, coin, bucket_idx), 1)
+    np.add.at(matrix, (side, coin, bucket_idx, 0), value)
+    np.add.at(matrix, (side, coin, bucket_idx, leverage_col), value)
+    return counts, matrix
+
+
+def bucket_row(price, row, cumulative):
+    """Build the output entry for one price bucket from its matrix row"""
+    entry = {'price': price, 'value': row[0], 'cumulative': cumulative}
+    for label, col in LEV_COL.items():
+        entry[label] = row[col]
+    return entry
+
+
 def aggregate_liquidations(all_positions, current_prices):
     """Aggregate liquidation data by price levels"""
     result = {}
+    positions = build_position_arrays(all_positions)
+    
+    # Determine price range around current price and create price buckets
+    prices = np.array([current_prices.get(coin, 0) for coin in TOP_COINS], dtype=np.float64)
+    price_min = prices * (1 - PRICE_RANGE)
+    price_max = prices * (1 + PRICE_RANGE)
+    bucket_size = (price_max - price_min) / NUM_BUCKETS
+    
+    # Bucket center prices for every coin in one go
+    centers = price_min[:, None] + (np.arange(NUM_BUCKETS) + 0.5) * bucket_size[:, None]
     
-    for coin in TOP_COINS:
+    # Long positions get liquidated below entry, shorts above
+    counts, matrix = bucketize(positions, price_min, price_max, bucket_size, NUM_BUCKETS)
+    
+    # Count positions for every coin in one pass
+    position_counts = np.bincount(positions['coin'], minlength=len(TOP_COINS)).tolist()
+    
+    for coin_id, coin in enumerate(TOP_COINS):
         current_price = current_prices.get(coin, 0)
         if current_price == 0:
             continue
         
-        # Filter positions for this coin
-        coin_positions = [p for p in all_positions if p['coin'] == coin]
-        
-        if not coin_positions:
+        position_count = position_counts[coin_id]
+        if not position_count:
             continue
         
-        # Determine price range (±30% from current price)
-        price_min = current_price * 0.7
-        price_max = current_price * 1.3
-        
-        # Create price buckets (50 buckets)
-        num_buckets = 50
-        bucket_size = (price_max - price_min) / num_buckets
-        
-        # Initialize buckets
-        long_liquidations = defaultdict(lambda: {'total': 0, '10x': 0, '25x': 0, '50x': 0, '100x': 0})
-        short_liquidations = defaultdict(lambda: {'total': 0, '10x': 0, '25x': 0, '50x': 0, '100x': 0})
-        
-        cumulative_long = 0
-        cumulative_short = 0
-        
-        for pos in coin_positions:
-            liq_price = pos['liquidationPx']
-            value = pos['positionValue']
-            leverage_bucket = pos['leverageBucket']
-            
-            # Find bucket index
-            if price_min <= liq_price <= price_max:
-                bucket_idx = int((liq_price - price_min) / bucket_size)
-                bucket_idx = min(bucket_idx, num_buckets - 1)
-                bucket_price = price_min + (bucket_idx + 0.5) * bucket_size
-                
-                if pos['side'] == 'long':
-                    # Long positions get liquidated below entry
-                    long_liquidations[bucket_price]['total'] += value
-                    long_liquidations[bucket_price][leverage_bucket] += value
-                    cumulative_long += value
-                else:
-                    # Short positions get liquidated above entry
-                    short_liquidations[bucket_price]['total'] += value
-                    short_liquidations[bucket_price][leverage_bucket] += value
-                    cumulative_short += value
-        
-        # Convert to sorted lists
-        long_data = []
-        short_data = []
+        # Python's round() is correctly rounded; np.round can shift half-cent prices by 0.01
+        coin_centers = [round(price, 2) for price in centers[coin_id].tolist()]
+        long_counts, short_counts = counts[:, coin_id]
+        long_mat, short_mat = matrix[:, coin_id]
+        long_rows = long_mat.tolist()
+        short_rows = short_mat.tolist()
         
-        # Calculate cumulative values
-        sorted_long_prices = sorted(long_liquidations.keys(), reverse=True)
-        sorted_short_prices = sorted(short_liquidations.keys())
+        # Cumulative values: longs accumulate from the top of the range down, shorts from the bottom up
+        long_cum = np.cumsum(long_mat[::-1, 0])[::-1].tolist()
+        short_cum = np.cumsum(short_mat[:, 0]).tolist()
         
-        cum_long = 0
-        for price in sorted_long_prices:
-            cum_long += long_liquidations[price]['total']
-            long_data.append({
-                'price': round(price, 2),
-                'value': long_liquidations[price]['total'],
-                'cumulative': cum_long,
-                '10x': long_liquidations[price]['10x'],
-                '25x': long_liquidations[price]['25x'],
-                '50x': long_liquidations[price]['50x'],
-                '100x': long_liquidations[price]['100x']
-            })
-        
-        cum_short = 0
-        for price in sorted_short_prices:
-            cum_short += short_liquidations[price]['total']
-            short_data.append({
-                'price': round(price, 2),
-                'value': short_liquidations[price]['total'],
-                'cumulative': cum_short,
-                '10x': short_liquidations[price]['10x'],
-                '25x': short_liquidations[price]['25x'],
-                '50x': short_liquidations[price]['50x'],
-                '100x': short_liquidations[price]['100x']
-            })
-        
-        # Sort by price for display
-        long_data.sort(key=lambda x: x['price'])
-        short_data.sort(key=lambda x: x['price'])
+        # Occupied buckets in ascending price order
+        long_data = [bucket_row(coin_centers[i], long_rows[i], long_cum[i])
+                     for i in np.flatnonzero(long_counts).tolist()]
+        short_data = [bucket_row(coin_centers[i], short_rows[i], short_cum[i])
+                      for i in np.flatnonzero(short_counts).tolist()]
         
         result[coin] = {
             'currentPrice': current_price,
             'longLiquidations': long_data,
             'shortLiquidations': short_data,
-            'totalLongValue': cumulative_long,
-            'totalShortValue': cumulative_short,
-            'positionCount': len(coin_positions)
+            'totalLongValue': float(long_mat[:, 0].sum()),
+            'totalShortValue': float(short_mat[:, 0].sum()),
+            'positionCount': position_count
         }
     
     return result
 
 
-def main():
+async def main():
     print("=" * 50)
     print("Hyperliquid Liquidation Heatmap Fetcher")
     print("=" * 50)
     
-    # Fetch current prices
-    print("\n1. Fetching current prices...")
-    current_prices = fetch_current_prices()
-    print(f"  Got prices for {len(current_prices)} coins")
-    
-    # Fetch leaderboard
-    print("\n2. Fetching leaderboard...")
-    wallets = fetch_leaderboard()
+    # The weight budget and the cap on in-flight requests, shared by every task of this run
+    limiter = AsyncLimiter(RATE_LIMIT_WEIGHT, 60)
+    slots = asyncio.Semaphore(MAX_CONCURRENCY)
     
-    if not wallets:
-        print("  Failed to fetch leaderboard, using alternative method...")
-        # Alternative: fetch from known active traders or use a fallback
-        payload = {"type": "allMids"}
-        # For now, we'll create sample data if leaderboard fails
-        wallets = []
-    
-    # Fetch positions for each wallet
-    print(f"\n3. Fetching positions for {len(wallets)} traders...")
-    all_positions = []
-    
-    for i, wallet in enumerate(wallets):
-        positions = fetch_clearinghouse_state(wallet)
-        all_positions.extend(positions)
+    # One HTTP/2 client for every request, so all /info calls share a TLS connection
+    async with httpx.AsyncClient(http2=True, headers=HEADERS, limits=CLIENT_LIMITS) as client:
+        # Fetch current prices
+        print("\n1. Fetching current prices...")
+        current_prices = await fetch_current_prices(client, limiter, slots)
+        print(f"  Got prices for {len(current_prices)} coins")
+        
+        # Fetch leaderboard
+        print("\n2. Fetching leaderboard...")
+        wallets = await fetch_leaderboard(client, limiter, slots)
+        
+        if not wallets:
+            print("  Failed to fetch leaderboard, using alternative method...")
+            # Alternative: fetch from known active traders or use a fallback
+            payload = {"type": "allMids"}
+            # For now, we'll create sample data if leaderboard fails
+            wallets = []
         
-        if (i + 1) % 20 == 0:
-            print(f"  Processed {i + 1}/{len(wallets)} wallets ({len(all_positions)} positions found)")
+        # Drop duplicate addresses, keeping leaderboard order
+        wallets = list(dict.fromkeys(w.lower() for w in wallets))
         
-        # Rate limiting
-        time.sleep(0.1)
+        # Fetch positions for each wallet
+        print(f"\n3. Fetching positions for {len(wallets)} traders...")
+        all_positions = await fetch_all_positions(client, limiter, slots, wallets)
     
     print(f"  Total positions: {len(all_positions)}")
     
@@ -322,12 +463,14 @@ def main():
         print(f"  {coin}: {data['positionCount']} positions, "
               f"Long ${data['totalLongValue']:,.0f}, Short ${data['totalShortValue']:,.0f}")
     
-    # Save to JSON
-    with open(DATA_FILE, 'w') as f:
-        json.dump(output, f, indent=2)
+    # Save to JSON via a temp file so readers never see a partial write
+    tmp_file = DATA_FILE + '.tmp'
+    with open(tmp_file, 'wb') as f:
+        f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    os.replace(tmp_file, DATA_FILE)
     
     print(f"\nSaved to {DATA_FILE}")
 
 
 if __name__ == '__main__':
-    main()
+    asyncio.run(main())